@@ -9,6 +9,7 @@ This interactive UI demonstrates:
 
 import streamlit as st
 import numpy as np
+import io
 import sys
 import os
 from pathlib import Path
@@ -18,10 +19,9 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from bb84.experiments_runner import run_experiment, run_eve_sweep
 from bb84.plot_results import plot_qber, plot_qber_vs_eve, plot_key_length_vs_eve
-from Crypto.Cipher import AES
-from Crypto.Random import get_random_bytes
-from Crypto.Util.Padding import pad, unpad
-import hashlib
+from cryptography.hazmat.primitives import hashes, padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 
 # Page configuration
@@ -31,27 +31,107 @@ st.set_page_config(
     layout="wide"
 )
 
+# AES block size in bytes (also the CBC IV length)
+AES_BLOCK_SIZE = 16
 
-def derive_aes_key(quantum_key: list) -> bytes:
+
+def derive_aes_key(quantum_key: np.ndarray) -> bytes:
     """
-    Derive a 128-bit AES key from the quantum key using SHA-256.
+    Derive a 128-bit AES key from the quantum key using HKDF-SHA256.
     
     Args:
-        quantum_key: List of bits from BB84 protocol
+        quantum_key: Array (or list) of bits from BB84 protocol
     
     Returns:
         16-byte AES key
     """
-    # Convert bit list to byte string
-    key_string = ''.join(str(bit) for bit in quantum_key)
+    # Pack bits 8 per byte (avoids building a '0101...' string)
+    bits = np.asarray(quantum_key, dtype=np.uint8)
+    packed = np.packbits(bits).tobytes()
     
-    # Hash to get consistent 256-bit output, take first 128 bits for AES-128
-    hash_obj = hashlib.sha256(key_string.encode())
-    aes_key = hash_obj.digest()[:16]  # AES-128 requires 16 bytes
+    # HKDF-SHA256 expands to exactly 16 bytes, as required by AES-128.
+    # The bit count goes into info so zero-padded keys of different
+    # lengths cannot derive the same AES key
+    info = b'bb84-aes128' + len(bits).to_bytes(4, 'big')
+    hkdf = HKDF(algorithm=hashes.SHA256(), length=16, salt=None, info=info)
+    aes_key = hkdf.derive(packed)
     
     return aes_key
 
 
+@st.cache_data(show_spinner=False)
+def cached_eve_sweep(num_qubits: int, eve_probs: tuple, trials: int) -> dict:
+    """
+    Run (or reuse) the Eve parameter sweep for the performance plots.
+    
+    Streamlit re-executes the whole script on every widget interaction, so
+    the sweep is cached on its inputs instead of being recomputed each rerun.
+    
+    Args:
+        num_qubits: Number of qubits per experiment
+        eve_probs: Tuple of Eve interception probabilities (hashable)
+        trials: Number of trials per probability value
+    
+    Returns:
+        Dictionary of per-probability result arrays from run_eve_sweep
+    """
+    return run_eve_sweep(num_qubits=num_qubits, eve_probs=list(eve_probs), trials=trials)
+
+
+def figure_to_png(fig) -> bytes:
+    """
+    Render a figure to PNG bytes with the same settings as st.pyplot.
+    
+    Args:
+        fig: Matplotlib Figure object
+    
+    Returns:
+        PNG image bytes
+    """
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=200, bbox_inches='tight')
+    return buf.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def cached_qber_plot(qber: float, secure: bool) -> bytes:
+    """
+    Build (or reuse) the rendered QBER bar chart for a given error rate.
+    
+    The PNG bytes are cached rather than the Figure, so reruns neither
+    redraw nor re-encode the chart. The verdict is part of the cache key,
+    so the bar color always matches the unrounded QBER.
+    
+    Args:
+        qber: Quantum Bit Error Rate rounded to 4 decimal places
+        secure: Whether the unrounded QBER is within the security threshold
+    
+    Returns:
+        PNG image bytes
+    """
+    return figure_to_png(plot_qber(qber, secure))
+
+
+@st.cache_data(show_spinner=False)
+def cached_sweep_plots(num_qubits: int, eve_probs: tuple, trials: int) -> tuple:
+    """
+    Build (or reuse) the rendered performance plots for an Eve parameter sweep.
+    
+    Keyed on the sweep inputs, so the figures are only drawn once per sweep.
+    
+    Args:
+        num_qubits: Number of qubits per experiment
+        eve_probs: Tuple of Eve interception probabilities (hashable)
+        trials: Number of trials per probability value
+    
+    Returns:
+        Tuple of PNG image bytes (QBER vs Eve, key length vs Eve)
+    """
+    sweep_results = cached_eve_sweep(num_qubits, eve_probs, trials)
+    return (figure_to_png(plot_qber_vs_eve(sweep_results)),
+            figure_to_png(plot_key_length_vs_eve(sweep_results)))
+
+
 def encrypt_message(message: str, key: bytes) -> tuple:
     """
     Encrypt a message using AES-128 in CBC mode.
@@ -63,9 +143,15 @@ def encrypt_message(message: str, key: bytes) -> tuple:
     Returns:
         Tuple of (ciphertext, iv)
     """
-    cipher = AES.new(key, AES.MODE_CBC)
-    ct_bytes = cipher.encrypt(pad(message.encode('utf-8'), AES.block_size))
-    return ct_bytes, cipher.iv
+    iv = os.urandom(AES_BLOCK_SIZE)
+    cipher = Cipher(algorithms.AES128(key), modes.CBC(iv))
+    
+    padder = padding.PKCS7(AES_BLOCK_SIZE * 8).padder()
+    padded = padder.update(message.encode('utf-8')) + padder.finalize()
+    
+    encryptor = cipher.encryptor()
+    ct_bytes = encryptor.update(padded) + encryptor.finalize()
+    return ct_bytes, iv
 
 
 def decrypt_message(ciphertext: bytes, key: bytes, iv: bytes) -> str:
@@ -80,8 +166,13 @@ def decrypt_message(ciphertext: bytes, key: bytes, iv: bytes) -> str:
     Returns:
         Decrypted plaintext message
     """
-    cipher = AES.new(key, AES.MODE_CBC, iv)
-    pt = unpad(cipher.decrypt(ciphertext), AES.block_size)
+    cipher = Cipher(algorithms.AES128(key), modes.CBC(iv))
+    
+    decryptor = cipher.decryptor()
+    padded = decryptor.update(ciphertext) + decryptor.finalize()
+    
+    unpadder = padding.PKCS7(AES_BLOCK_SIZE * 8).unpadder()
+    pt = unpadder.update(padded) + unpadder.finalize()
     return pt.decode('utf-8')
 
 
@@ -168,22 +259,23 @@ def main():
         
         qber_value = result['qber']
         qber_percent = qber_value * 100
+        threshold = 11.0
+        secure = qber_percent <= threshold
         
         col1, col2 = st.columns([1, 2])
         
         with col1:
             st.metric("QBER", f"{qber_percent:.2f}%")
             
-            threshold = 11.0
-            if qber_percent <= threshold:
+            if secure:
                 st.success(f"✅ Secure: QBER ≤ {threshold}%")
             else:
                 st.error(f"⚠️ Insecure: QBER > {threshold}%")
                 st.warning("Eavesdropping detected! Key should be discarded.")
         
         with col2:
-            fig_qber = plot_qber(qber_value)
-            st.pyplot(fig_qber)
+            png_qber = cached_qber_plot(round(qber_value, 4), secure)
+            st.image(png_qber, width='stretch')
         
         # Section 3: Quantum Key Preview
         st.header("3️⃣ Quantum Key Preview")
@@ -197,12 +289,12 @@ def main():
             bob_preview = bob_key[:preview_bits]
             
             st.text("Alice's Key (first 64 bits):")
-            st.code(''.join(str(b) for b in alice_preview), language=None)
+            st.code(''.join(alice_preview.astype('U1')), language=None)
             
             st.text("Bob's Key (first 64 bits):")
-            st.code(''.join(str(b) for b in bob_preview), language=None)
+            st.code(''.join(bob_preview.astype('U1')), language=None)
             
-            if alice_preview == bob_preview:
+            if np.array_equal(alice_preview, bob_preview):
                 st.success("✅ Keys match perfectly!")
             else:
                 st.error("❌ Key mismatch detected!")
@@ -252,17 +344,15 @@ def main():
         with st.spinner("Generating performance plots..."):
             # Run parameter sweep
             eve_probs = np.linspace(0.0, 1.0, 11)
-            sweep_results = run_eve_sweep(num_qubits=500, eve_probs=eve_probs.tolist(), trials=5)
+            png_qber_vs_eve, png_key_vs_eve = cached_sweep_plots(500, tuple(eve_probs.tolist()), 5)
             
             col1, col2 = st.columns(2)
             
             with col1:
-                fig_qber_vs_eve = plot_qber_vs_eve(sweep_results)
-                st.pyplot(fig_qber_vs_eve)
+                st.image(png_qber_vs_eve, width='stretch')
             
             with col2:
-                fig_key_vs_eve = plot_key_length_vs_eve(sweep_results)
-                st.pyplot(fig_key_vs_eve)
+                st.image(png_key_vs_eve, width='stretch')
         
         st.divider()
         
@@ -285,7 +375,7 @@ def main():
             - Security threshold: QBER > 11% indicates eavesdropping
             
             **AES Integration:**
-            - Quantum key is hashed with SHA-256 to derive AES-128 key
+            - Quantum key is packed into bytes and run through HKDF-SHA256 to derive the AES-128 key
             - Message is encrypted using AES in CBC mode
             - Provides information-theoretic security when QBER is acceptable
             """)
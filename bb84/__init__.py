@@ -5,7 +5,8 @@ BB84 Quantum Key Distribution Package
 from .bb84_core import bb84_protocol
 from .eve_attack import eve_intercept_resend
 from .experiments import run_bb84, run_bb84_with_eve
-from .experiments_runner import run_experiment, run_eve_sweep
+from .experiments_runner import run_experiment, run_eve_sweep, results_as_records
+from .sweep_dispatcher import dispatch_sweep
 
 __all__ = [
     'bb84_protocol',
@@ -13,5 +14,7 @@ __all__ = [
     'run_bb84',
     'run_bb84_with_eve',
     'run_experiment',
-    'run_eve_sweep'
+    'run_eve_sweep',
+    'results_as_records',
+    'dispatch_sweep'
 ]
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""
+Numba-compiled kernels for the BB84 simulation hot paths
+
+Each kernel computes its outputs in a single fused pass without the
+temporary arrays that the equivalent chain of NumPy operations allocates.
+Randomness is drawn by the caller with NumPy's Generator (which is faster
+than Numba's RNG) and passed in.
+
+Numba is optional: when it is not installed, NUMBA_AVAILABLE is False and
+callers fall back to their vectorized NumPy implementations.
+"""
+
+import os
+import numpy as np
+
+try:
+    import numba
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+    
+    # The TBB layer keeps the interpreter from exiting once a parallel kernel
+    # has run off the main thread (as in Streamlit's script thread), so prefer
+    # OpenMP, then the workqueue layer. This is a process-wide Numba setting,
+    # so an explicit NUMBA_THREADING_LAYER_PRIORITY is left untouched
+    if 'NUMBA_THREADING_LAYER_PRIORITY' not in os.environ:
+        numba.config.THREADING_LAYER_PRIORITY = ['omp', 'workqueue', 'tbb']
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+def _jit(func=None, *, parallel=False):
+    """Compile func with Numba when available, otherwise return it unchanged."""
+    if func is None:
+        return lambda f: _jit(f, parallel=parallel)
+    if NUMBA_AVAILABLE:
+        return njit(cache=True, parallel=parallel)(func)
+    return func
+
+
+@_jit
+def _measure_kernel(alice_bits, alice_bases, bob_bases, random_bits, out):
+    """
+    Fill out with Bob's measurement results.
+
+    Matching bases copy Alice's bit; mismatched bases take the
+    pre-drawn random bit.
+    """
+    for i in range(out.shape[0]):
+        if alice_bases[i] == bob_bases[i]:
+            out[i] = alice_bits[i]
+        else:
+            out[i] = random_bits[i]
+
+
+@_jit
+def _count_errors(alice_key, bob_key):
+    """Count the positions where two equal-length bit arrays differ."""
+    errors = 0
+    for i in range(alice_key.shape[0]):
+        errors += alice_key[i] ^ bob_key[i]
+    return errors
+
+
+@_jit(parallel=True)
+def _sweep_kernel(num_qubits, eve_probs, trials, seed):
+    """
+    Run a full Eve sweep (BB84 with intercept-resend) in native code.
+
+    Each qubit is simulated with scalar draws from Numba's RNG, so no arrays
+    are allocated per trial; only the error and key-length counters are kept.
+    The flattened (probability, trial) tasks are spread across threads, and
+    each task reseeds its thread's RNG with seed + task index so results do
+    not depend on scheduling.
+
+    Returns (qbers, key_lengths), each shaped (len(eve_probs), trials).
+    """
+    num_probs = eve_probs.shape[0]
+    qbers = np.empty((num_probs, trials))
+    key_lengths = np.empty((num_probs, trials), dtype=np.int64)
+
+    for task in prange(num_probs * trials):
+        p = task // trials
+        t = task % trials
+        np.random.seed(seed + task)
+        eve_probability = eve_probs[p]
+
+        key_length = 0
+        errors = 0
+
+        for _ in range(num_qubits):
+            alice_bit = np.random.randint(0, 2)
+            alice_basis = np.random.randint(0, 2)
+
+            # Eve measures in a random basis and resends what she saw
+            sent_bit = alice_bit
+            sent_basis = alice_basis
+            if np.random.random() < eve_probability:
+                eve_basis = np.random.randint(0, 2)
+                if eve_basis != alice_basis:
+                    sent_bit = np.random.randint(0, 2)
+                sent_basis = eve_basis
+
+            # Only qubits surviving basis reconciliation contribute
+            bob_basis = np.random.randint(0, 2)
+            if bob_basis == alice_basis:
+                key_length += 1
+                if bob_basis == sent_basis:
+                    bob_bit = sent_bit
+                else:
+                    bob_bit = np.random.randint(0, 2)
+                if bob_bit != alice_bit:
+                    errors += 1
+
+        key_lengths[p, t] = key_length
+        qbers[p, t] = errors / key_length if key_length > 0 else 0.0
+
+    return qbers, key_lengths
+
+
+def _warm_up():
+    """
+    Trigger compilation (or a cache load) for the uint8 bit/basis arrays.
+
+    The sweep kernel is left to compile on first use to keep imports fast.
+    """
+    bits = np.zeros(1, dtype=np.uint8)
+    _measure_kernel(bits, bits, bits, bits, np.empty_like(bits))
+    _count_errors(bits, bits)
+
+
+if NUMBA_AVAILABLE:
+    _warm_up()
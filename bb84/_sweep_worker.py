@@ -0,0 +1,38 @@
+"""
+Worker entry point for dispatched BB84 sweeps
+
+Each scheduler job runs one parameter combination:
+
+    python -m bb84._sweep_worker CONFIG_PATH RESULT_PATH
+
+CONFIG_PATH is a JSON file with num_qubits, eve_probability and trials; the
+sweep statistics for that combination are written to RESULT_PATH as JSON.
+"""
+
+import sys
+import json
+from .experiments_runner import run_eve_sweep, results_as_records
+
+
+def main(config_path: str, result_path: str) -> None:
+    """
+    Run the trials for one parameter combination and save the statistics.
+
+    Args:
+        config_path: Path of the job's JSON config
+        result_path: Path to write the JSON result to
+    """
+    with open(config_path) as f:
+        config = json.load(f)
+
+    results = run_eve_sweep(config['num_qubits'], [config['eve_probability']],
+                            trials=config['trials'])
+    record = results_as_records(results)[0]
+    record['num_qubits'] = config['num_qubits']
+
+    with open(result_path, 'w') as f:
+        json.dump(record, f)
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:3])
\ No newline at end of file
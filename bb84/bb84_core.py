@@ -7,11 +7,20 @@ basis reconciliation, and final key extraction.
 """
 
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, Tuple
+from ._kernels import NUMBA_AVAILABLE, _count_errors, _measure_kernel
+
+
+# Shared generator for protocol randomness (avoids the legacy global RandomState)
+_rng = np.random.default_rng()
+
+# np.bitwise_count (popcount) is only available from NumPy 2.0
+_HAS_BITWISE_COUNT = hasattr(np, 'bitwise_count')
 
 
 def bb84_protocol(num_qubits: int, alice_bits: np.ndarray = None, 
-                  alice_bases: np.ndarray = None, bob_bases: np.ndarray = None) -> Dict:
+                  alice_bases: np.ndarray = None, bob_bases: np.ndarray = None,
+                  rng: np.random.Generator = None, seed: int = None) -> Dict:
     """
     Execute the BB84 quantum key distribution protocol.
     
@@ -20,35 +29,59 @@ def bb84_protocol(num_qubits: int, alice_bits: np.ndarray = None,
         alice_bits: Optional pre-generated Alice bits (for reproducibility)
         alice_bases: Optional pre-generated Alice bases (for reproducibility)
         bob_bases: Optional pre-generated Bob bases (for reproducibility)
+        rng: Optional random generator (defaults to the module generator)
+        seed: Optional seed for a fresh generator (ignored if rng is given)
     
     Returns:
         Dictionary containing:
             - qber: Quantum Bit Error Rate
-            - alice_key: Final key bits from Alice's side
-            - bob_key: Final key bits from Bob's side
+            - alice_key: Final key bits from Alice's side (uint8 array)
+            - bob_key: Final key bits from Bob's side (uint8 array)
             - matching_bases_count: Number of matching bases
             - total_qubits: Total qubits transmitted
     """
+    if rng is None:
+        rng = _rng if seed is None else np.random.default_rng(seed)
+    
+    if alice_bits is None and alice_bases is None and bob_bases is None:
+        # Nothing pre-generated: run the whole protocol as one fused pass
+        alice_sifted_key, bob_sifted_key, qber, matching_count = _run_bb84_vectorized(
+            num_qubits, rng
+        )
+        return {
+            'qber': qber,
+            'alice_key': alice_sifted_key,
+            'bob_key': bob_sifted_key,
+            'matching_bases_count': matching_count,
+            'total_qubits': num_qubits
+        }
     
     # Step 1: Alice generates random bits
+    # Pre-generated arrays are narrowed to uint8 like the generated ones
     if alice_bits is None:
-        alice_bits = np.random.randint(0, 2, num_qubits)
+        alice_bits = rng.integers(0, 2, num_qubits, dtype=np.uint8)
+    else:
+        alice_bits = np.asarray(alice_bits, dtype=np.uint8)
     
     # Step 2: Alice selects random bases (0 = Z-basis, 1 = X-basis)
     if alice_bases is None:
-        alice_bases = np.random.randint(0, 2, num_qubits)
+        alice_bases = rng.integers(0, 2, num_qubits, dtype=np.uint8)
+    else:
+        alice_bases = np.asarray(alice_bases, dtype=np.uint8)
     
     # Step 3: Alice encodes qubits based on bits and bases
     # In real QKD, this would be done with photon polarization
-    # Here we simulate the classical information
-    alice_qubits = encode_qubits(alice_bits, alice_bases)
+    # Here the (bit, basis) arrays already are the simulated qubits,
+    # so they go straight to Bob's measurement (see encode_qubits)
     
     # Step 4: Bob selects random bases for measurement
     if bob_bases is None:
-        bob_bases = np.random.randint(0, 2, num_qubits)
+        bob_bases = rng.integers(0, 2, num_qubits, dtype=np.uint8)
+    else:
+        bob_bases = np.asarray(bob_bases, dtype=np.uint8)
     
     # Step 5: Bob measures qubits in his chosen bases
-    bob_bits = measure_qubits(alice_qubits, alice_bases, bob_bases)
+    bob_bits = measure_qubits(alice_bits, alice_bases, bob_bases, rng)
     
     # Step 6: Basis reconciliation (public channel)
     # Alice and Bob compare bases and keep only matching ones
@@ -60,21 +93,21 @@ def bb84_protocol(num_qubits: int, alice_bits: np.ndarray = None,
     
     # Step 8: Calculate QBER (should be ~0% without Eve)
     if len(alice_sifted_key) > 0:
-        errors = np.sum(alice_sifted_key != bob_sifted_key)
+        errors = count_errors(alice_sifted_key, bob_sifted_key)
         qber = errors / len(alice_sifted_key)
     else:
         qber = 0.0
     
     return {
         'qber': qber,
-        'alice_key': alice_sifted_key.tolist(),
-        'bob_key': bob_sifted_key.tolist(),
+        'alice_key': alice_sifted_key,
+        'bob_key': bob_sifted_key,
         'matching_bases_count': np.sum(matching_bases),
         'total_qubits': num_qubits
     }
 
 
-def encode_qubits(bits: np.ndarray, bases: np.ndarray) -> np.ndarray:
+def encode_qubits(bits: np.ndarray, bases: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
     Encode classical bits into quantum states based on chosen bases.
     
@@ -86,16 +119,16 @@ def encode_qubits(bits: np.ndarray, bases: np.ndarray) -> np.ndarray:
         bases: Bases to use for encoding
     
     Returns:
-        Encoded quantum states (represented classically)
+        Tuple of (bits, bases) arrays representing the encoded quantum states
     """
-    # In simulation, we just store the (bit, basis) pair
+    # In simulation, the (bit, basis) pair fully describes each qubit, so the
+    # two arrays are returned untouched; the simulation paths skip this call
     # Real implementation would prepare photon polarization states
-    qubits = np.column_stack((bits, bases))
-    return qubits
+    return bits, bases
 
 
-def measure_qubits(qubits: np.ndarray, alice_bases: np.ndarray, 
-                   bob_bases: np.ndarray) -> np.ndarray:
+def measure_qubits(alice_bits: np.ndarray, alice_bases: np.ndarray, 
+                   bob_bases: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
     """
     Simulate Bob measuring qubits in his chosen bases.
     
@@ -103,22 +136,104 @@ def measure_qubits(qubits: np.ndarray, alice_bases: np.ndarray,
     If Bob's basis differs: measurement result is random (50/50)
     
     Args:
-        qubits: Encoded quantum states from Alice
+        alice_bits: Bits encoded in the qubits Bob receives
         alice_bases: Alice's encoding bases
         bob_bases: Bob's measurement bases
+        rng: Optional random generator (defaults to the module generator)
     
     Returns:
         Bob's measurement results
     """
-    alice_bits = qubits[:, 0].astype(int)
-    bob_bits = np.zeros(len(qubits), dtype=int)
-    
-    for i in range(len(qubits)):
-        if alice_bases[i] == bob_bases[i]:
-            # Matching bases: Bob gets Alice's bit with certainty
-            bob_bits[i] = alice_bits[i]
-        else:
-            # Non-matching bases: Bob gets random result (50/50)
-            bob_bits[i] = np.random.randint(0, 2)
-    
-    return bob_bits
\ No newline at end of file
+    if rng is None:
+        rng = _rng
+    
+    num_qubits = len(alice_bits)
+    random_bits = rng.integers(0, 2, size=num_qubits, dtype=np.uint8)
+    
+    # Matching bases: Bob gets Alice's bit with certainty
+    # Non-matching bases: Bob gets random result (50/50)
+    if NUMBA_AVAILABLE:
+        bob_bits = np.empty(num_qubits, dtype=np.uint8)
+        _measure_kernel(alice_bits, alice_bases, bob_bases, random_bits, bob_bits)
+    else:
+        match = alice_bases == bob_bases
+        bob_bits = np.where(match, alice_bits, random_bits)
+    
+    return bob_bits
+
+
+def count_errors(alice_key: np.ndarray, bob_key: np.ndarray) -> int:
+    """
+    Count the positions where two sifted keys disagree.
+    
+    With Numba installed the keys are XORed and summed in a single compiled
+    loop. Otherwise both keys are packed 8 bits per byte so the comparison is
+    a XOR plus popcount over N/8 bytes instead of an element-wise compare
+    over N.
+    
+    Args:
+        alice_key: Alice's sifted key bits (0/1)
+        bob_key: Bob's sifted key bits (0/1)
+    
+    Returns:
+        Number of mismatched bits
+    """
+    if NUMBA_AVAILABLE:
+        return int(_count_errors(alice_key, bob_key))
+    
+    diff = np.bitwise_xor(np.packbits(alice_key), np.packbits(bob_key))
+    return _popcount(diff)
+
+
+def _popcount(packed: np.ndarray) -> int:
+    """
+    Count the set bits in a packed uint8 array.
+    
+    Args:
+        packed: Bits packed 8 per byte
+    
+    Returns:
+        Number of 1 bits
+    """
+    if _HAS_BITWISE_COUNT:
+        return int(np.bitwise_count(packed).sum())
+    return int(np.unpackbits(packed).sum())
+
+
+def _run_bb84_vectorized(num_qubits: int,
+                         rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray, float, int]:
+    """
+    Run the full eavesdropper-free BB84 protocol in one fused pass.
+    
+    Equivalent to the step-by-step path in bb84_protocol, but skips the
+    encode/measure helpers and their intermediate arrays. All random bits
+    are drawn packed 8 per byte, and basis reconciliation and Bob's
+    measurement are done with bitwise ops on the packed bytes (8 qubits
+    per operation); only the basis mask and the two keys are unpacked
+    for sifting. The four random streams come from a single rng.integers
+    call, because each call has a fixed dispatch cost comparable to
+    generating the bytes themselves.
+    
+    Args:
+        num_qubits: Number of qubits to transmit
+        rng: Random generator for all protocol randomness
+    
+    Returns:
+        Tuple of (alice_sifted_key, bob_sifted_key, qber, matching_bases_count)
+    """
+    num_bytes = (num_qubits + 7) // 8
+    # One draw fills all four streams
+    alice_bits, alice_bases, bob_bases, random_bits = rng.integers(
+        0, 256, (4, num_bytes), dtype=np.uint8
+    )
+    
+    # Bit set where bases match: Bob reads Alice's bit there, a coin flip elsewhere
+    match_packed = ~(alice_bases ^ bob_bases)
+    bob_bits = (alice_bits & match_packed) | (random_bits & ~match_packed)
+    
+    match = np.unpackbits(match_packed, count=num_qubits).view(bool)
+    alice_sifted_key = np.unpackbits(alice_bits, count=num_qubits)[match]
+    bob_sifted_key = np.unpackbits(bob_bits, count=num_qubits)[match]
+    qber = count_errors(alice_sifted_key, bob_sifted_key) / max(1, alice_sifted_key.size)
+    
+    return alice_sifted_key, bob_sifted_key, qber, alice_sifted_key.size
\ No newline at end of file
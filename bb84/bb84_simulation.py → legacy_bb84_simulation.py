@@ -14,9 +14,8 @@ Active development uses modular files in the `bb84/` directory:
 - eve_attack.py
 - experiments.py
 """
+import os
 import numpy as np
-from qiskit import QuantumCircuit
-from qiskit_aer import Aer
 import matplotlib.pyplot as plt
 
 from Crypto.Cipher import AES
@@ -27,13 +26,30 @@ from Crypto.Util.Padding import pad, unpad
 # -----------------------------
 NUM_QUBITS = 1024
 QBER_THRESHOLD = 0.11
-simulator = Aer.get_backend('qasm_simulator')
+rng = np.random.default_rng()
+
+# Bases are stored as integer codes rather than 'Z'/'X' strings
+Z_BASIS, X_BASIS = 0, 1
+
+# Qiskit/Aer circuit simulation is kept only for pedagogical use; the
+# default path samples the same outcomes directly.
+USE_QISKIT = False
+
+if USE_QISKIT:
+    from qiskit import QuantumCircuit, transpile
+    from qiskit_aer import AerSimulator
+    # Configured once so every batched run spreads its circuits over all cores
+    simulator = AerSimulator(
+        method='statevector',
+        max_parallel_threads=os.cpu_count(),
+        max_parallel_experiments=os.cpu_count(),
+    )
 
 # -----------------------------
 # ALICE GENERATES BITS & BASES
 # -----------------------------
-alice_bits = np.random.randint(2, size=NUM_QUBITS)
-alice_bases = np.random.choice(['Z', 'X'], size=NUM_QUBITS)
+alice_bits = rng.integers(2, size=NUM_QUBITS, dtype=np.uint8)
+alice_bases = rng.integers(2, size=NUM_QUBITS, dtype=np.uint8)
 
 print("Alice bits:  ", alice_bits)
 print("Alice bases: ", alice_bases)
@@ -42,76 +58,91 @@ print("Alice bases: ", alice_bases)
 # QUBIT ENCODING FUNCTION
 # -----------------------------
 def encode_qubit(bit, basis):
-    qc = QuantumCircuit(1, 1)
+    # Two classical bits: Eve's measurement result and Bob's
+    qc = QuantumCircuit(1, 2)
 
     if bit == 1:
         qc.x(0)
 
-    if basis == 'X':
+    if basis == X_BASIS:
         qc.h(0)
 
     return qc
 
 # -----------------------------
-# EVE INTERCEPT–RESEND ATTACK
+# INTERCEPT-RESEND CIRCUIT TEMPLATES
 # -----------------------------
-def eve_intercept(circuit, eve_basis): 
-    eve_circuit = circuit.copy()
+# Eve's measurement and resend are folded into a single circuit: she measures
+# mid-circuit into clbit 0, the collapsed qubit is rotated back into her basis
+# (which is exactly the state she would resend), and Bob measures into clbit 1.
+# A circuit depends only on (bit, Alice basis, Eve basis, Bob basis), so the
+# 16 possible circuits are built and transpiled once and every qubit reuses one.
+def intercept_circuit(bit, alice_basis, eve_basis, bob_basis):
+    qc = encode_qubit(bit, alice_basis)
 
-    if eve_basis == 'X':
-        eve_circuit.h(0)
-
-    eve_circuit.measure(0, 0)
+    if eve_basis == X_BASIS:
+        qc.h(0)
 
-    job = simulator.run(eve_circuit, shots=1)
-    result = job.result()
-    measured_bit = int(list(result.get_counts().keys())[0])
+    qc.measure(0, 0)
 
-    resend = QuantumCircuit(1, 1)
+    if eve_basis == X_BASIS:
+        qc.h(0)
 
-    if measured_bit == 1:
-        resend.x(0)
+    if bob_basis == X_BASIS:
+        qc.h(0)
 
-    if eve_basis == 'X':
-        resend.h(0)
+    qc.measure(0, 1)
 
-    return resend
+    return qc
 
-# -----------------------------
-# ALICE PREPARES QUBITS
-# -----------------------------
-alice_circuits = [
-    encode_qubit(alice_bits[i], alice_bases[i])
-    for i in range(NUM_QUBITS)
-]
+if USE_QISKIT:
+    templates = {
+        (bit, alice_basis, eve_basis, bob_basis): transpile(
+            intercept_circuit(bit, alice_basis, eve_basis, bob_basis), simulator
+        )
+        for bit in (0, 1)
+        for alice_basis in (Z_BASIS, X_BASIS)
+        for eve_basis in (Z_BASIS, X_BASIS)
+        for bob_basis in (Z_BASIS, X_BASIS)
+    }
+
+def run_intercept_resend(bits, alice_bases, eve_bases, bob_bases):
+    # One batched simulator job covers Eve's and Bob's measurements for every
+    # qubit
+    circuits = [
+        templates[(int(bit), int(a), int(e), int(b))]
+        for bit, a, e, b in zip(bits, alice_bases, eve_bases, bob_bases)
+    ]
+    result = simulator.run(circuits, shots=1).result()
+
+    # Count keys read as "<clbit 1><clbit 0>", i.e. "<Bob><Eve>"
+    outcomes = [next(iter(result.get_counts(i))) for i in range(len(circuits))]
+    eve_bits = np.array([int(key[1]) for key in outcomes], dtype=np.uint8)
+    bob_bits = np.array([int(key[0]) for key in outcomes], dtype=np.uint8)
+    return eve_bits, bob_bits
 
 # -----------------------------
 # BOB & EVE BASE SELECTION
 # -----------------------------
-bob_bases = np.random.choice(['Z', 'X'], size=NUM_QUBITS)
-eve_bases = np.random.choice(['Z', 'X'], size=NUM_QUBITS)
-bob_results = []
+bob_bases = rng.integers(2, size=NUM_QUBITS, dtype=np.uint8)
+eve_bases = rng.integers(2, size=NUM_QUBITS, dtype=np.uint8)
 
 # -----------------------------
 # TRANSMISSION: ALICE → EVE → BOB
 # -----------------------------
-for i in range(NUM_QUBITS):
-    qc = alice_circuits[i]
-
-    # Eve intercepts
-    qc = eve_intercept(qc, eve_bases[i])
-
-    # Bob measures
-    if bob_bases[i] == 'X':
-        qc.h(0)
-
-    qc.measure(0, 0)
-
-    job = simulator.run(qc, shots=1)
-    result = job.result()
-    measured_bit = int(list(result.get_counts().keys())[0])
-
-    bob_results.append(measured_bit)
+if USE_QISKIT:
+    # Eve intercepts and measures Alice's qubits, then resends them in her
+    # basis; Bob measures the resent qubits
+    eve_bits, bob_results = run_intercept_resend(
+        alice_bits, alice_bases, eve_bases, bob_bases
+    )
+else:
+    # Measuring in the preparation basis returns the encoded bit; measuring
+    # in the other basis returns a fair coin flip.
+    eve_bits = np.where(eve_bases == alice_bases, alice_bits,
+                        rng.integers(2, size=NUM_QUBITS, dtype=np.uint8))
+    bob_results = np.where(bob_bases == eve_bases, eve_bits,
+                           rng.integers(2, size=NUM_QUBITS, dtype=np.uint8))
 
 print("Bob bases:   ", bob_bases)
 print("Bob results: ", bob_results)
@@ -119,13 +150,9 @@ print("Bob results: ", bob_results)
 # -----------------------------
 # BASIS RECONCILIATION
 # -----------------------------
-alice_key = []
-bob_key = []
-
-for i in range(NUM_QUBITS):
-    if alice_bases[i] == bob_bases[i]:
-        alice_key.append(alice_bits[i])
-        bob_key.append(bob_results[i])
+mask = alice_bases == bob_bases
+alice_key = alice_bits[mask].tolist()
+bob_key = bob_results[mask].tolist()
 
 print("Alice final key:", alice_key)
 print("Bob final key:  ", bob_key)
@@ -133,7 +160,7 @@ print("Bob final key:  ", bob_key)
 # -----------------------------
 # QBER CALCULATION
 # -----------------------------
-errors = sum(1 for a, b in zip(alice_key, bob_key) if a != b)
+errors = int((alice_bits[mask] ^ bob_results[mask]).sum())
 qber = errors / len(alice_key) if len(alice_key) > 0 else 0
 
 print("Errors:", errors)
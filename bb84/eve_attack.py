@@ -10,8 +10,15 @@ import numpy as np
 from typing import Tuple
 
 
-def eve_intercept_resend(alice_qubits: np.ndarray, alice_bases: np.ndarray,
-                         eve_probability: float) -> Tuple[np.ndarray, np.ndarray, int]:
+# Shared generator for Eve's basis choices and measurement outcomes
+_rng = np.random.default_rng()
+
+
+def eve_intercept_resend(alice_bits: np.ndarray, alice_bases: np.ndarray,
+                         eve_probability: float,
+                         rng: np.random.Generator = None,
+                         eve_bases: np.ndarray = None,
+                         eve_coins: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray, int]:
     """
     Simulate Eve's intercept-resend attack on the quantum channel.
     
@@ -24,49 +31,96 @@ def eve_intercept_resend(alice_qubits: np.ndarray, alice_bases: np.ndarray,
     
     This introduces errors when Eve's basis doesn't match Alice's basis.
     
+    The arrays are packed 8 qubits per byte on the way in and unpacked on
+    the way out; the attack itself runs on the packed bytes.
+    
     Args:
-        alice_qubits: Original qubits from Alice (bit, basis pairs)
-        alice_bases: Alice's encoding bases
+        alice_bits: Bits encoded in Alice's original qubits (0/1)
+        alice_bases: Alice's encoding bases (0 = Z, 1 = X)
         eve_probability: Probability that Eve intercepts each qubit
+        rng: Optional random generator (defaults to the module generator)
+        eve_bases: Optional pre-drawn bases for Eve's measurements (0/1)
+        eve_coins: Optional pre-drawn outcomes for Eve's measurements in a
+            mismatched basis (drawn from rng when either is omitted)
     
     Returns:
         Tuple of:
-            - modified_qubits: Qubits after potential Eve interception
+            - modified_bits: Bits after potential Eve interception
             - modified_bases: Bases after potential Eve interception
             - interceptions: Number of qubits intercepted by Eve
     """
-    num_qubits = len(alice_qubits)
-    alice_bits = alice_qubits[:, 0].astype(int)
-    
-    # Create copies that may be modified by Eve
-    modified_bits = alice_bits.copy()
-    modified_bases = alice_bases.copy()
-    
-    # Track number of interceptions
-    interceptions = 0
-    
-    for i in range(num_qubits):
-        # Eve intercepts with probability eve_probability
-        if np.random.random() < eve_probability:
-            interceptions += 1
-            
-            # Eve randomly selects a measurement basis
-            eve_basis = np.random.randint(0, 2)
-            
-            # Eve measures the qubit
-            if eve_basis == alice_bases[i]:
-                # Eve's basis matches Alice's: measurement is deterministic
-                eve_bit = alice_bits[i]
-            else:
-                # Eve's basis differs: measurement is random (50/50)
-                eve_bit = np.random.randint(0, 2)
-            
-            # Eve prepares and sends a new qubit in the measured state
-            # This effectively changes the qubit that Bob will receive
-            modified_bits[i] = eve_bit
-            modified_bases[i] = eve_basis
-    
-    # Reconstruct modified qubits
-    modified_qubits = np.column_stack((modified_bits, modified_bases))
-    
-    return modified_qubits, modified_bases, interceptions
\ No newline at end of file
+    if rng is None:
+        rng = _rng
+    
+    num_qubits = len(alice_bits)
+    if eve_bases is not None and eve_coins is not None:
+        eve_bases = np.packbits(np.asarray(eve_bases, dtype=np.uint8))
+        eve_coins = np.packbits(np.asarray(eve_coins, dtype=np.uint8))
+    
+    sent_bits, sent_bases, interceptions = _eve_intercept_packed(
+        np.packbits(np.asarray(alice_bits, dtype=np.uint8)),
+        np.packbits(np.asarray(alice_bases, dtype=np.uint8)),
+        eve_probability, num_qubits, rng, eve_bases=eve_bases, eve_coins=eve_coins
+    )
+    
+    modified_bits = np.unpackbits(sent_bits, count=num_qubits)
+    modified_bases = np.unpackbits(sent_bases, count=num_qubits)
+    return modified_bits, modified_bases, interceptions
+
+
+def _eve_intercept_packed(alice_bits: np.ndarray, alice_bases: np.ndarray,
+                          eve_probability: float, num_qubits: int,
+                          rng: np.random.Generator,
+                          eve_bases: np.ndarray = None,
+                          eve_coins: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Intercept-resend attack on streams packed 8 qubits per byte.
+    
+    Same model as eve_intercept_resend, but every bit and basis stream is
+    packed (np.packbits order), so Eve's measurement and resend are bitwise
+    ops on the bytes.
+    
+    Args:
+        alice_bits: Packed bits encoded in Alice's original qubits
+        alice_bases: Packed encoding bases (1 = X basis)
+        eve_probability: Probability that Eve intercepts each qubit
+        num_qubits: Number of qubits in the packed streams
+        rng: Random generator for Eve's draws
+        eve_bases: Optional pre-drawn packed bases for Eve's measurements
+        eve_coins: Optional pre-drawn packed outcomes for Eve's measurements
+            in a mismatched basis (drawn from rng when either is omitted)
+    
+    Returns:
+        Tuple of:
+            - modified_bits: Packed bits after potential Eve interception
+            - modified_bases: Packed bases after potential Eve interception
+            - interceptions: Number of qubits intercepted by Eve
+    """
+    if eve_probability == 0.0:
+        return alice_bits.copy(), alice_bases.copy(), 0
+    
+    # Eve randomly selects a measurement basis for each qubit and measures:
+    # deterministic when her basis matches Alice's, random (50/50) otherwise
+    if eve_bases is None or eve_coins is None:
+        eve_bases, eve_coins = rng.integers(0, 256, (2, len(alice_bits)), dtype=np.uint8)
+    eve_match = ~(eve_bases ^ alice_bases)
+    eve_bits = (alice_bits & eve_match) | (eve_coins & ~eve_match)
+    
+    if eve_probability == 1.0:
+        # Every qubit is intercepted, so Eve's qubits are sent as-is
+        return eve_bits, eve_bases, num_qubits
+    
+    # The number of intercepted qubits is Binomial(n, p); pick which ones
+    # directly instead of drawing a full-length Bernoulli mask, then pack
+    # the chosen positions into a byte mask
+    interceptions = int(rng.binomial(num_qubits, eve_probability))
+    intercept_mask = np.zeros(num_qubits, dtype=bool)
+    intercept_mask[rng.choice(num_qubits, interceptions, replace=False)] = True
+    intercepted = np.packbits(intercept_mask)
+    
+    # Eve prepares and sends a new qubit in the measured state
+    # This effectively changes the qubit that Bob will receive
+    modified_bits = (eve_bits & intercepted) | (alice_bits & ~intercepted)
+    modified_bases = (eve_bases & intercepted) | (alice_bases & ~intercepted)
+    
+    return modified_bits, modified_bases, interceptions
\ No newline at end of file
@@ -7,75 +7,131 @@ with and without Eve's presence.
 
 import numpy as np
 from typing import Dict
-from .bb84_core import bb84_protocol
-from .eve_attack import eve_intercept_resend
+from .bb84_core import _popcount, bb84_protocol, count_errors
+from .eve_attack import _eve_intercept_packed
 
 
-def run_bb84(num_qubits: int) -> Dict:
+# Shared generator for experiment randomness (avoids the legacy global RandomState)
+_rng = np.random.default_rng()
+
+
+def run_bb84(num_qubits: int, rng: np.random.Generator = None) -> Dict:
     """
     Run BB84 protocol without any eavesdropping.
     
     Args:
         num_qubits: Number of qubits to transmit
+        rng: Optional random generator (defaults to the module generator)
     
     Returns:
         Dictionary with BB84 results including QBER and keys
     """
-    result = bb84_protocol(num_qubits)
+    result = bb84_protocol(num_qubits, rng=rng)
     result['eve_present'] = False
     result['eve_probability'] = 0.0
     return result
 
 
-def run_bb84_with_eve(num_qubits: int, eve_probability: float) -> Dict:
+def run_bb84_with_eve(num_qubits: int, eve_probability: float,
+                      rng: np.random.Generator = None, summary_only: bool = False) -> Dict:
     """
     Run BB84 protocol with Eve performing intercept-resend attack.
     
     Args:
         num_qubits: Number of qubits to transmit
         eve_probability: Probability that Eve intercepts each qubit
+        rng: Optional random generator (defaults to the module generator)
+        summary_only: Return only 'qber' and 'key_length', computed on the
+            packed streams without materializing the sifted keys
     
     Returns:
         Dictionary with BB84 results including QBER and keys
     """
+    if rng is None:
+        rng = _rng
+    
+    # Every bit/basis stream is packed 8 qubits per byte, and Eve's and Bob's
+    # measurements are evaluated with bitwise ops on the packed bytes
+    num_bytes = (num_qubits + 7) // 8
+    
+    # Without interceptions the run is plain BB84
+    if eve_probability == 0.0:
+        if summary_only:
+            # Every sifted bit agrees, so only the bases need to be drawn
+            alice_bases, bob_bases = rng.integers(0, 256, (2, num_bytes), dtype=np.uint8)
+            key_length = _popcount(_packed_match(alice_bases, bob_bases, num_qubits))
+            return {'qber': 0.0, 'key_length': key_length}
+        result = run_bb84(num_qubits, rng=rng)
+        result['eve_present'] = True
+        result['eve_interceptions'] = 0
+        return result
+    
     # Step 1: Alice generates bits and bases
-    alice_bits = np.random.randint(0, 2, num_qubits)
-    alice_bases = np.random.randint(0, 2, num_qubits)
+    # (Eve's and Bob's uniform streams come from the same draw)
+    (alice_bits, alice_bases, eve_bases, eve_coins,
+     bob_bases, bob_coins) = rng.integers(0, 256, (6, num_bytes), dtype=np.uint8)
     
     # Step 2: Alice encodes qubits
-    from .bb84_core import encode_qubits
-    alice_qubits = encode_qubits(alice_bits, alice_bases)
+    # The (bit, basis) streams already describe the qubits, so they are
+    # passed on as-is instead of going through encode_qubits
     
     # Step 3: Eve intercepts (with probability eve_probability)
-    modified_qubits, modified_bases, interceptions = eve_intercept_resend(
-        alice_qubits, alice_bases, eve_probability
+    sent_bits, sent_bases, interceptions = _eve_intercept_packed(
+        alice_bits, alice_bases, eve_probability, num_qubits, rng,
+        eve_bases=eve_bases, eve_coins=eve_coins
     )
     
     # Step 4: Bob selects bases and measures
-    bob_bases = np.random.randint(0, 2, num_qubits)
-    
-    from .bb84_core import measure_qubits
-    bob_bits = measure_qubits(modified_qubits, modified_bases, bob_bases)
+    bob_match = ~(bob_bases ^ sent_bases)
+    bob_bits = (sent_bits & bob_match) | (bob_coins & ~bob_match)
     
     # Step 5: Basis reconciliation
-    matching_bases = alice_bases == bob_bases
-    alice_sifted_key = alice_bits[matching_bases]
-    bob_sifted_key = bob_bits[matching_bases]
+    if summary_only:
+        # Key length and errors are popcounts over the packed match mask
+        match = _packed_match(alice_bases, bob_bases, num_qubits)
+        key_length = _popcount(match)
+        errors = _popcount((alice_bits ^ bob_bits) & match)
+        return {'qber': errors / key_length if key_length > 0 else 0.0, 'key_length': key_length}
+    
+    matching_bases = np.unpackbits(~(alice_bases ^ bob_bases), count=num_qubits).view(bool)
+    alice_sifted_key = np.unpackbits(alice_bits, count=num_qubits)[matching_bases]
+    bob_sifted_key = np.unpackbits(bob_bits, count=num_qubits)[matching_bases]
     
     # Step 6: Calculate QBER
     if len(alice_sifted_key) > 0:
-        errors = np.sum(alice_sifted_key != bob_sifted_key)
+        errors = count_errors(alice_sifted_key, bob_sifted_key)
         qber = errors / len(alice_sifted_key)
     else:
         qber = 0.0
     
     return {
         'qber': qber,
-        'alice_key': alice_sifted_key.tolist(),
-        'bob_key': bob_sifted_key.tolist(),
+        'alice_key': alice_sifted_key,
+        'bob_key': bob_sifted_key,
         'matching_bases_count': np.sum(matching_bases),
         'total_qubits': num_qubits,
         'eve_present': True,
         'eve_probability': eve_probability,
         'eve_interceptions': interceptions
-    }
\ No newline at end of file
+    }
+
+
+def _packed_match(alice_bases: np.ndarray, bob_bases: np.ndarray, num_qubits: int) -> np.ndarray:
+    """
+    Packed mask of the qubits whose bases match.
+    
+    The padding bits of the last byte are cleared so the mask can be
+    popcounted directly.
+    
+    Args:
+        alice_bases: Alice's packed bases
+        bob_bases: Bob's packed bases
+        num_qubits: Number of qubits in the packed streams
+    
+    Returns:
+        Packed uint8 mask with a bit set where the bases match
+    """
+    match = ~(alice_bases ^ bob_bases)
+    if num_qubits % 8:
+        match[-1] &= (0xFF << (8 - num_qubits % 8)) & 0xFF
+    return match
\ No newline at end of file
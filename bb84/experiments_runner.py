@@ -5,9 +5,19 @@ This module provides functions to run single experiments and parameter sweeps
 for analyzing BB84 performance under various conditions.
 """
 
+import os
+import threading
 import numpy as np
-from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
 from .experiments import run_bb84, run_bb84_with_eve
+from ._kernels import NUMBA_AVAILABLE, _sweep_kernel
+
+
+# The workqueue threading layer (Numba's fallback when OpenMP is missing)
+# does not allow concurrent launches, so sweeps from several threads (e.g.
+# Streamlit sessions) take turns; each launch already uses every core
+_sweep_kernel_lock = threading.Lock()
 
 
 def run_experiment(num_qubits: int, eve_enabled: bool, eve_probability: float = 0.0) -> Dict:
@@ -28,42 +38,130 @@ def run_experiment(num_qubits: int, eve_enabled: bool, eve_probability: float =
         return run_bb84(num_qubits)
 
 
-def run_eve_sweep(num_qubits: int, eve_probs: List[float], trials: int = 10) -> List[Dict]:
+def _sweep_trial(num_qubits: int, eve_probability: float,
+                 seed: np.random.SeedSequence) -> Tuple[float, int]:
+    """
+    Run one BB84 trial of a sweep with its own independent random stream.
+    
+    Args:
+        num_qubits: Number of qubits to transmit
+        eve_probability: Probability of Eve intercepting each qubit
+        seed: Seed sequence for this trial's random generator
+    
+    Returns:
+        Tuple of (qber, final key length)
+    """
+    rng = np.random.default_rng(seed)
+    result = run_bb84_with_eve(num_qubits, eve_probability, rng=rng, summary_only=True)
+    return result['qber'], result['key_length']
+
+
+def _collect_trials(outcomes: Iterable[Tuple[float, int]],
+                    num_trials: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Store trial outcomes in preallocated arrays as they arrive.
+    
+    Args:
+        outcomes: Iterable of (qber, final key length) pairs
+        num_trials: Total number of trials in outcomes
+    
+    Returns:
+        Tuple of (qbers, key lengths) arrays in trial order
+    """
+    qbers = np.empty(num_trials)
+    key_lengths = np.empty(num_trials, dtype=np.int64)
+    
+    for i, (qber, key_length) in enumerate(outcomes):
+        qbers[i] = qber
+        key_lengths[i] = key_length
+    
+    return qbers, key_lengths
+
+
+def run_eve_sweep(num_qubits: int, eve_probs: List[float], trials: int = 10,
+                  num_workers: Optional[int] = None, seed: Optional[int] = None) -> Dict[str, np.ndarray]:
     """
     Run multiple BB84 experiments sweeping Eve's interception probability.
     
     This is useful for analyzing how QBER scales with Eve's presence.
+    With Numba installed the sweep runs in a compiled multi-threaded kernel;
+    otherwise the independent trials are distributed across worker processes.
+    
+    The two paths draw from different random generators, so the same seed
+    reproduces a sweep only on the same path: results with Numba installed
+    differ from the process-pool results. num_workers only applies to the
+    process-pool path; the Numba kernel always uses all threads.
     
     Args:
         num_qubits: Number of qubits per experiment
         eve_probs: List of Eve interception probabilities to test
         trials: Number of trials per probability value
+        num_workers: Number of worker processes for the non-Numba path (None
+            uses all CPU cores, 1 runs every trial sequentially in-process);
+            ignored when Numba is installed
+        seed: Optional seed making the sweep reproducible on a given path
     
     Returns:
-        List of dictionaries, each containing:
-            - eve_probability: The Eve probability tested
+        Dictionary of float64 arrays, one entry per Eve probability:
+            - eve_probability: The Eve probabilities tested
             - mean_qber: Average QBER across trials
             - std_qber: Standard deviation of QBER
             - mean_key_length: Average final key length
             - std_key_length: Standard deviation of key length
     """
-    results = []
+    seed_seq = np.random.SeedSequence(seed)
     
-    for eve_prob in eve_probs:
-        qbers = []
-        key_lengths = []
+    if NUMBA_AVAILABLE:
+        # The whole sweep runs in one compiled, multi-threaded kernel
+        kernel_seed = int(seed_seq.generate_state(1)[0] % 2**31)
+        with _sweep_kernel_lock:
+            all_qbers, all_key_lengths = _sweep_kernel(
+                num_qubits, np.asarray(eve_probs, dtype=np.float64), trials, kernel_seed
+            )
+    else:
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        
+        # Flatten (probability, trial) pairs; each trial gets its own child seed
+        # so parallel workers never share a random stream
+        jobs = [eve_prob for eve_prob in eve_probs for _ in range(trials)]
+        seeds = seed_seq.spawn(len(jobs))
         
-        for _ in range(trials):
-            result = run_bb84_with_eve(num_qubits, eve_prob)
-            qbers.append(result['qber'])
-            key_lengths.append(len(result['alice_key']))
+        if num_workers == 1:
+            outcomes = map(_sweep_trial, [num_qubits] * len(jobs), jobs, seeds)
+            all_qbers, all_key_lengths = _collect_trials(outcomes, len(jobs))
+        else:
+            # A few chunks per worker balances load without per-task IPC
+            chunksize = max(1, len(jobs) // (4 * num_workers))
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                outcomes = executor.map(_sweep_trial, [num_qubits] * len(jobs), jobs, seeds,
+                                        chunksize=chunksize)
+                all_qbers, all_key_lengths = _collect_trials(outcomes, len(jobs))
         
-        results.append({
-            'eve_probability': eve_prob,
-            'mean_qber': np.mean(qbers),
-            'std_qber': np.std(qbers),
-            'mean_key_length': np.mean(key_lengths),
-            'std_key_length': np.std(key_lengths)
-        })
-    
-    return results
\ No newline at end of file
+        all_qbers = all_qbers.reshape(len(eve_probs), trials)
+        all_key_lengths = all_key_lengths.reshape(len(eve_probs), trials)
+    
+    # Statistics for every probability in one pass over the (probs, trials) arrays
+    results = {
+        'eve_probability': np.asarray(eve_probs, dtype=np.float64),
+        'mean_qber': all_qbers.mean(axis=1),
+        'std_qber': all_qbers.std(axis=1),
+        'mean_key_length': all_key_lengths.mean(axis=1),
+        'std_key_length': all_key_lengths.std(axis=1)
+    }
+    
+    return results
+
+
+def results_as_records(results: Dict[str, np.ndarray]) -> List[Dict]:
+    """
+    Convert run_eve_sweep output into one dictionary per Eve probability.
+    
+    Args:
+        results: Dictionary of per-probability arrays from run_eve_sweep
+    
+    Returns:
+        List of dictionaries with the same keys, holding scalar values
+    """
+    keys = list(results)
+    return [dict(zip(keys, row)) for row in zip(*(results[key].tolist() for key in keys))]
\ No newline at end of file
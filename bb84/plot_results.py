@@ -5,31 +5,37 @@ This module provides matplotlib-based visualization functions that return
 Figure objects compatible with Streamlit.
 """
 
-import matplotlib.pyplot as plt
 import matplotlib
-from typing import List, Dict
+from matplotlib.figure import Figure
+from typing import Dict, Optional
+import numpy as np
 
 # Use non-interactive backend for Streamlit compatibility
 matplotlib.use('Agg')
 
 
-def plot_qber(qber: float) -> plt.Figure:
+def plot_qber(qber: float, secure: Optional[bool] = None) -> Figure:
     """
     Create a visual representation of QBER with security threshold.
     
     Args:
         qber: Quantum Bit Error Rate (0.0 to 1.0)
+        secure: Security verdict for the bar color (default: qber <= 11%)
     
     Returns:
         Matplotlib Figure object
     """
-    fig, ax = plt.subplots(figsize=(8, 4))
+    # Figures are built without pyplot, so nothing is kept in its global registry
+    fig = Figure(figsize=(8, 4), layout='tight')
+    ax = fig.subplots()
     
     # Security threshold for BB84 is typically 11%
     threshold = 0.11
     
     # Create bar chart
-    colors = ['green' if qber <= threshold else 'red']
+    if secure is None:
+        secure = qber <= threshold
+    colors = ['green' if secure else 'red']
     bars = ax.bar(['QBER'], [qber * 100], color=colors, alpha=0.7, edgecolor='black')
     
     # Add threshold line
@@ -44,31 +50,28 @@ def plot_qber(qber: float) -> plt.Figure:
     ax.grid(axis='y', alpha=0.3)
     
     # Add value label on bar
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.2f}%',
-                ha='center', va='bottom', fontsize=11, fontweight='bold')
+    ax.bar_label(bars, labels=[f'{qber*100:.2f}%'], padding=3,
+                 fontsize=11, fontweight='bold')
     
-    plt.tight_layout()
     return fig
 
 
-def plot_qber_vs_eve(results: List[Dict]) -> plt.Figure:
+def plot_qber_vs_eve(results: Dict[str, np.ndarray]) -> Figure:
     """
     Plot QBER as a function of Eve's interception probability.
     
     Args:
-        results: List of experiment results from run_eve_sweep
+        results: Dictionary of per-probability arrays from run_eve_sweep
     
     Returns:
         Matplotlib Figure object
     """
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6), layout='tight')
+    ax = fig.subplots()
     
-    eve_probs = [r['eve_probability'] for r in results]
-    mean_qbers = [r['mean_qber'] * 100 for r in results]
-    std_qbers = [r['std_qber'] * 100 for r in results]
+    eve_probs = results['eve_probability']
+    mean_qbers = results['mean_qber'] * 100
+    std_qbers = results['std_qber'] * 100
     
     # Plot with error bars
     ax.errorbar(eve_probs, mean_qbers, yerr=std_qbers, 
@@ -80,7 +83,7 @@ def plot_qber_vs_eve(results: List[Dict]) -> plt.Figure:
                linewidth=2, label='Security Threshold (11%)')
     
     # Theoretical QBER = 0.25 * eve_probability
-    theoretical_qber = [25 * p for p in eve_probs]
+    theoretical_qber = 25 * eve_probs
     ax.plot(eve_probs, theoretical_qber, 'g--', 
             linewidth=2, alpha=0.7, label='Theoretical (25% × p)')
     
@@ -92,25 +95,25 @@ def plot_qber_vs_eve(results: List[Dict]) -> plt.Figure:
     ax.grid(True, alpha=0.3)
     ax.set_xlim(-0.05, 1.05)
     
-    plt.tight_layout()
     return fig
 
 
-def plot_key_length_vs_eve(results: List[Dict]) -> plt.Figure:
+def plot_key_length_vs_eve(results: Dict[str, np.ndarray]) -> Figure:
     """
     Plot final key length as a function of Eve's interception probability.
     
     Args:
-        results: List of experiment results from run_eve_sweep
+        results: Dictionary of per-probability arrays from run_eve_sweep
     
     Returns:
         Matplotlib Figure object
     """
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6), layout='tight')
+    ax = fig.subplots()
     
-    eve_probs = [r['eve_probability'] for r in results]
-    mean_lengths = [r['mean_key_length'] for r in results]
-    std_lengths = [r['std_key_length'] for r in results]
+    eve_probs = results['eve_probability']
+    mean_lengths = results['mean_key_length']
+    std_lengths = results['std_key_length']
     
     # Plot with error bars
     ax.errorbar(eve_probs, mean_lengths, yerr=std_lengths,
@@ -125,5 +128,4 @@ def plot_key_length_vs_eve(results: List[Dict]) -> plt.Figure:
     ax.grid(True, alpha=0.3)
     ax.set_xlim(-0.05, 1.05)
     
-    plt.tight_layout()
     return fig
\ No newline at end of file
@@ -0,0 +1,168 @@
+"""
+Sweep Dispatcher for BB84 Experiments
+
+This module runs Eve sweeps over a grid of (num_qubits, eve_probability)
+parameters, either in-process or as independent jobs on a SLURM cluster.
+The SLURM scheduler uses parasweep, which is an optional dependency.
+"""
+
+import os
+import sys
+import glob
+import json
+import uuid
+import numpy as np
+from typing import Dict, List
+from .experiments_runner import run_eve_sweep
+
+
+# Config template rendered by parasweep for each job (braces are escaped for
+# Python format strings)
+_CONFIG_TEMPLATE = (
+    '{{"num_qubits": {num_qubits}, "eve_probability": {eve_probability}, '
+    '"trials": {trials}}}\n'
+)
+
+# Directory containing the bb84 package; jobs run from here so that
+# `python -m bb84._sweep_worker` can import the package
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Columns of a dispatched sweep's results, in output order
+_RESULT_KEYS = ['num_qubits', 'eve_probability', 'mean_qber', 'std_qber',
+                'mean_key_length', 'std_key_length']
+
+
+def dispatch_sweep(param_grid: Dict[str, List], trials: int, scheduler: str = 'local',
+                   output_dir: str = 'outputs') -> Dict[str, np.ndarray]:
+    """
+    Run an Eve sweep for every combination of the parameters in param_grid.
+    
+    With scheduler='local' each num_qubits value is swept in-process with
+    run_eve_sweep. With scheduler='slurm' every (num_qubits, eve_probability)
+    pair is submitted through parasweep's DRMAA dispatcher as its own job,
+    which runs bb84._sweep_worker from the project root (with the root on
+    PYTHONPATH) and writes a JSON result to output_dir. The project root and
+    output_dir must be on a filesystem shared with the compute nodes.
+    
+    Args:
+        param_grid: Dictionary with 'num_qubits' and 'eve_probability' lists
+        trials: Number of trials per parameter combination
+        scheduler: 'local' or 'slurm'
+        output_dir: Directory for job configs and results (SLURM only)
+    
+    Returns:
+        Dictionary of arrays, one entry per parameter combination, with the
+        run_eve_sweep statistics plus a num_qubits column
+    """
+    if scheduler == 'local':
+        return _dispatch_local(param_grid, trials)
+    if scheduler == 'slurm':
+        return _dispatch_slurm(param_grid, trials, output_dir)
+    raise ValueError(f"Unknown scheduler '{scheduler}' (expected 'local' or 'slurm')")
+
+
+def _dispatch_local(param_grid: Dict[str, List], trials: int) -> Dict[str, np.ndarray]:
+    """
+    Sweep every num_qubits value in-process.
+    
+    Args:
+        param_grid: Dictionary with 'num_qubits' and 'eve_probability' lists
+        trials: Number of trials per parameter combination
+    
+    Returns:
+        Dictionary of per-combination result arrays
+    """
+    eve_probs = list(param_grid['eve_probability'])
+    sweeps = []
+    
+    for num_qubits in param_grid['num_qubits']:
+        results = run_eve_sweep(num_qubits, eve_probs, trials=trials)
+        results['num_qubits'] = np.full(len(eve_probs), num_qubits, dtype=np.int64)
+        sweeps.append(results)
+    
+    return {key: np.concatenate([results[key] for results in sweeps]) for key in _RESULT_KEYS}
+
+
+def _dispatch_slurm(param_grid: Dict[str, List], trials: int,
+                    output_dir: str) -> Dict[str, np.ndarray]:
+    """
+    Submit one SLURM job per parameter combination and gather the results.
+    
+    Args:
+        param_grid: Dictionary with 'num_qubits' and 'eve_probability' lists
+        trials: Number of trials per parameter combination
+        output_dir: Directory for job configs and results
+    
+    Returns:
+        Dictionary of per-combination result arrays
+    
+    Raises:
+        RuntimeError: If some jobs did not write a result
+    """
+    try:
+        import drmaa
+        from parasweep import run_sweep, CartesianSweep
+        from parasweep.dispatchers import DRMAADispatcher
+    except ImportError as e:
+        raise ImportError("scheduler='slurm' requires parasweep (and drmaa): "
+                          "pip install parasweep drmaa") from e
+    
+    output_dir = os.path.abspath(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    sweep_id = uuid.uuid4().hex[:8]
+    
+    template_path = os.path.join(output_dir, f'template_{sweep_id}.json')
+    with open(template_path, 'w') as f:
+        f.write(_CONFIG_TEMPLATE)
+    
+    # {sim_id} is filled in by parasweep for each job and starts with sweep_id
+    config_path = os.path.join(output_dir, 'config_{sim_id}.json')
+    result_path = os.path.join(output_dir, 'sweep_{sim_id}.json')
+    command = f'{sys.executable} -m bb84._sweep_worker {config_path} {result_path}'
+    
+    sweep = CartesianSweep({
+        'num_qubits': list(param_grid['num_qubits']),
+        'eve_probability': list(param_grid['eve_probability']),
+        'trials': [trials]
+    })
+    # Jobs start in the project root with it on PYTHONPATH, since the
+    # scheduler does not inherit the submitting shell's directory
+    python_path = os.pathsep.join(filter(None, [_PROJECT_ROOT, os.environ.get('PYTHONPATH')]))
+    job_template = drmaa.JobTemplate(workingDirectory=_PROJECT_ROOT,
+                                     jobEnvironment={'PYTHONPATH': python_path})
+    run_sweep(command, configs=[config_path], templates=[template_path], sweep=sweep,
+              dispatcher=DRMAADispatcher(job_template), sweep_id=sweep_id,
+              save_mapping=False, verbose=False)
+    
+    results = collect_sweep_results(output_dir, sweep_id)
+    
+    # Failed jobs leave no result file; don't let them silently shrink the sweep
+    expected = len(sweep)
+    if len(results['num_qubits']) != expected:
+        raise RuntimeError(f"Only {len(results['num_qubits'])} of {expected} sweep jobs "
+                           f"wrote a result to {output_dir}")
+    
+    return results
+
+
+def collect_sweep_results(output_dir: str, sweep_id: str) -> Dict[str, np.ndarray]:
+    """
+    Combine the per-job JSON results of a dispatched sweep.
+    
+    Args:
+        output_dir: Directory the jobs wrote their results to
+        sweep_id: Identifier of the sweep
+    
+    Returns:
+        Dictionary of per-combination result arrays, ordered by num_qubits
+        and then eve_probability
+    """
+    records = []
+    
+    for path in glob.glob(os.path.join(output_dir, f'sweep_{sweep_id}_*.json')):
+        with open(path) as f:
+            records.append(json.load(f))
+    
+    results = {key: np.array([record[key] for record in records]) for key in _RESULT_KEYS}
+    order = np.lexsort((results['eve_probability'], results['num_qubits']))
+    return {key: values[order] for key, values in results.items()}
\ No newline at end of file
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
\ No newline at end of file
@@ -0,0 +1,89 @@
+"""
+Seeded checks for the public intercept-resend attack on unpacked bits.
+"""
+
+import numpy as np
+import pytest
+
+from bb84.eve_attack import eve_intercept_resend
+
+
+# Not a multiple of 8, so the packed streams carry padding bits
+NUM_QUBITS = 1003
+
+
+def _draws(seed):
+    rng = np.random.default_rng(seed)
+    alice_bits, alice_bases, eve_bases, eve_coins = rng.integers(
+        0, 2, (4, NUM_QUBITS), dtype=np.uint8
+    )
+    # What Eve reads and resends at every position she intercepts
+    eve_bits = np.where(eve_bases == alice_bases, alice_bits, eve_coins)
+    return alice_bits, alice_bases, eve_bases, eve_coins, eve_bits
+
+
+@pytest.mark.parametrize('eve_probability', [0.0, 0.5, 1.0])
+def test_outputs_are_unpacked_bits(eve_probability):
+    alice_bits, alice_bases, *_ = _draws(0)
+    
+    bits, bases, interceptions = eve_intercept_resend(
+        alice_bits, alice_bases, eve_probability, rng=np.random.default_rng(1)
+    )
+    
+    assert bits.dtype == bases.dtype == np.uint8
+    assert bits.shape == bases.shape == (NUM_QUBITS,)
+    assert set(np.unique(bits)) <= {0, 1}
+    assert set(np.unique(bases)) <= {0, 1}
+    assert 0 <= interceptions <= NUM_QUBITS
+
+
+def test_no_interception_leaves_qubits_unchanged():
+    alice_bits, alice_bases, *_ = _draws(0)
+    
+    bits, bases, interceptions = eve_intercept_resend(
+        alice_bits, alice_bases, 0.0, rng=np.random.default_rng(1)
+    )
+    
+    assert interceptions == 0
+    np.testing.assert_array_equal(bits, alice_bits)
+    np.testing.assert_array_equal(bases, alice_bases)
+
+
+def test_full_interception_resends_eve_measurements():
+    alice_bits, alice_bases, eve_bases, eve_coins, eve_bits = _draws(0)
+    
+    bits, bases, interceptions = eve_intercept_resend(
+        alice_bits, alice_bases, 1.0, rng=np.random.default_rng(1),
+        eve_bases=eve_bases, eve_coins=eve_coins
+    )
+    
+    assert interceptions == NUM_QUBITS
+    np.testing.assert_array_equal(bits, eve_bits)
+    np.testing.assert_array_equal(bases, eve_bases)
+
+
+def test_partial_interception_mixes_alice_and_eve_qubits():
+    alice_bits, alice_bases, eve_bases, eve_coins, eve_bits = _draws(0)
+    
+    bits, bases, interceptions = eve_intercept_resend(
+        alice_bits, alice_bases, 0.5, rng=np.random.default_rng(1),
+        eve_bases=eve_bases, eve_coins=eve_coins
+    )
+    
+    from_alice = (bits == alice_bits) & (bases == alice_bases)
+    from_eve = (bits == eve_bits) & (bases == eve_bases)
+    assert np.all(from_alice | from_eve)
+    # Only intercepted qubits can differ from Alice's
+    assert np.count_nonzero(~from_alice) <= interceptions
+    assert abs(interceptions - NUM_QUBITS / 2) < 5 * np.sqrt(NUM_QUBITS / 4)
+
+
+def test_same_seed_gives_same_attack():
+    alice_bits, alice_bases, *_ = _draws(0)
+    
+    first = eve_intercept_resend(alice_bits, alice_bases, 0.5, rng=np.random.default_rng(3))
+    second = eve_intercept_resend(alice_bits, alice_bases, 0.5, rng=np.random.default_rng(3))
+    
+    np.testing.assert_array_equal(first[0], second[0])
+    np.testing.assert_array_equal(first[1], second[1])
+    assert first[2] == second[2]
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""
+Seeded checks for the packed BB84 pipelines and the Eve sweep.
+"""
+
+import numpy as np
+import pytest
+
+from bb84 import experiments_runner
+from bb84.experiments import run_bb84_with_eve
+from bb84.experiments_runner import run_eve_sweep
+
+
+# Sizes that leave padding bits in the last packed byte, plus a full byte
+NUM_QUBITS = [1, 7, 8, 13, 1001]
+
+
+@pytest.mark.parametrize('num_qubits', NUM_QUBITS)
+@pytest.mark.parametrize('eve_probability', [0.3, 1.0])
+def test_summary_matches_full_run(num_qubits, eve_probability):
+    full = run_bb84_with_eve(num_qubits, eve_probability, rng=np.random.default_rng(5))
+    summary = run_bb84_with_eve(num_qubits, eve_probability, rng=np.random.default_rng(5),
+                                summary_only=True)
+    
+    assert summary['key_length'] == len(full['alice_key'])
+    assert summary['qber'] == full['qber']
+
+
+@pytest.mark.parametrize('num_qubits', NUM_QUBITS)
+def test_summary_without_eve_counts_only_real_qubits(num_qubits):
+    # Padding bits must never be counted as matching bases
+    for seed in range(20):
+        summary = run_bb84_with_eve(num_qubits, 0.0, rng=np.random.default_rng(seed),
+                                    summary_only=True)
+        assert summary['qber'] == 0.0
+        assert 0 <= summary['key_length'] <= num_qubits
+
+
+@pytest.mark.parametrize('num_qubits', NUM_QUBITS)
+def test_sifted_keys_have_one_bit_per_matching_basis(num_qubits):
+    result = run_bb84_with_eve(num_qubits, 0.5, rng=np.random.default_rng(1))
+    
+    assert len(result['alice_key']) == len(result['bob_key']) == result['matching_bases_count']
+    assert result['matching_bases_count'] <= num_qubits
+    assert set(np.unique(result['alice_key'])) <= {0, 1}
+
+
+def test_full_interception_qber_is_near_a_quarter():
+    result = run_bb84_with_eve(20000, 1.0, rng=np.random.default_rng(2))
+    
+    assert abs(result['qber'] - 0.25) < 0.02
+    assert result['eve_interceptions'] == 20000
+
+
+@pytest.mark.parametrize('use_numba', [True, False])
+def test_eve_sweep_is_deterministic_for_a_seed(monkeypatch, use_numba):
+    if use_numba and not experiments_runner.NUMBA_AVAILABLE:
+        pytest.skip('Numba is not installed')
+    monkeypatch.setattr(experiments_runner, 'NUMBA_AVAILABLE', use_numba)
+    
+    first = run_eve_sweep(200, [0.0, 0.5, 1.0], trials=3, num_workers=1, seed=7)
+    second = run_eve_sweep(200, [0.0, 0.5, 1.0], trials=3, num_workers=1, seed=7)
+    
+    assert first.keys() == second.keys()
+    for key in first:
+        np.testing.assert_array_equal(first[key], second[key])
+    assert first['mean_qber'][0] == 0.0
\ No newline at end of file
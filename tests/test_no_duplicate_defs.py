@@ -0,0 +1,32 @@
+"""
+Guard against a later definition silently shadowing an earlier one.
+"""
+
+import ast
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+SOURCES = sorted(ROOT.glob('bb84/*.py')) + sorted(ROOT.glob('UI/*.py'))
+
+
+def _duplicate_names(body):
+    names = Counter(
+        node.name for node in body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+    )
+    return sorted(name for name, count in names.items() if count > 1)
+
+
+@pytest.mark.parametrize('path', SOURCES, ids=lambda p: str(p.relative_to(ROOT)))
+def test_no_duplicate_definitions(path):
+    tree = ast.parse(path.read_text(encoding='utf-8'))
+    
+    duplicates = _duplicate_names(tree.body)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            duplicates += [f'{node.name}.{name}' for name in _duplicate_names(node.body)]
+    
+    assert duplicates == []
\ No newline at end of file